@@ -1,11 +1,11 @@
 import asyncio
-from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from hummingbot.connector.exchange.ascend_ex import ascend_ex_constants as CONSTANTS, ascend_ex_web_utils as web_utils
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
@@ -14,6 +14,9 @@ from hummingbot.logger import HummingbotLogger
 if TYPE_CHECKING:
     from hummingbot.connector.exchange.ascend_ex.ascend_ex_exchange import AscendExExchange
 
+_BUY_TRADE_TYPE = float(TradeType.BUY.value)
+_SELL_TRADE_TYPE = float(TradeType.SELL.value)
+
 
 class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
     _logger: Optional[HummingbotLogger] = None
@@ -28,7 +31,15 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._connector = connector
         self._trade_messages_queue_key = CONSTANTS.TRADE_TOPIC_ID
         self._diff_messages_queue_key = CONSTANTS.DIFF_TOPIC_ID
+        self._channels_by_topic = {
+            CONSTANTS.TRADE_TOPIC_ID: self._trade_messages_queue_key,
+            CONSTANTS.DIFF_TOPIC_ID: self._diff_messages_queue_key,
+        }
         self._api_factory = api_factory
+        self._subscription_requests: List[WSJSONRequest] = []
+        self._subscription_trading_pairs: Tuple[str, ...] = ()
+        self._trading_pairs_by_symbol: Dict[str, str] = {}
+        self._pending_diffs_by_pair: Dict[str, Dict[str, Any]] = {}
 
     async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
         return await self._connector.get_last_traded_prices(trading_pairs=trading_pairs)
@@ -59,11 +70,8 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
         :param ws: the websocket assistant used to connect to the exchange
         """
         try:
-            for trading_pair in self._trading_pairs:
-                trading_symbol = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
-                for topic in [CONSTANTS.DIFF_TOPIC_ID, CONSTANTS.TRADE_TOPIC_ID]:
-                    payload = {"op": CONSTANTS.SUB_ENDPOINT_NAME, "ch": f"{topic}:{trading_symbol}"}
-                    await ws.send(WSJSONRequest(payload=payload))
+            for subscription_request in await self._get_subscription_requests():
+                await ws.send(subscription_request)
 
             self.logger().info("Subscribed to public order book and trade channels...")
         except asyncio.CancelledError:
@@ -74,6 +82,26 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
             )
             raise
 
+    async def _get_subscription_requests(self) -> List[WSJSONRequest]:
+        """
+        Builds the subscription requests for the current trading pairs. The requests are kept and reused on every
+        reconnection, and only rebuilt when the list of trading pairs changes.
+        """
+        trading_pairs = tuple(self._trading_pairs)
+        if trading_pairs != self._subscription_trading_pairs:
+            trading_symbols = await safe_gather(
+                *[self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+                  for trading_pair in trading_pairs]
+            )
+            self._subscription_requests = [
+                WSJSONRequest(payload={"op": CONSTANTS.SUB_ENDPOINT_NAME, "ch": f"{topic}:{trading_symbol}"})
+                for trading_symbol in trading_symbols
+                for topic in [CONSTANTS.DIFF_TOPIC_ID, CONSTANTS.TRADE_TOPIC_ID]
+            ]
+            self._subscription_trading_pairs = trading_pairs
+            self._trading_pairs_by_symbol = dict(zip(trading_symbols, trading_pairs))
+        return self._subscription_requests
+
     async def _connected_websocket_assistant(self) -> WSAssistant:
         ws: WSAssistant = await self._api_factory.get_ws_assistant()
         await ws.connect(ws_url=f"{CONSTANTS.WS_URL}/{CONSTANTS.STREAM_PATH_URL}")
@@ -96,46 +124,70 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return snapshot_msg
 
     async def _parse_trade_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
-        trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(symbol=raw_message["symbol"])
+        symbol = raw_message["symbol"]
+        trading_pair = (self._trading_pairs_by_symbol.get(symbol)
+                        or await self._connector.trading_pair_associated_to_exchange_symbol(symbol=symbol))
         for trade_data in raw_message["data"]:
             timestamp: float = trade_data["ts"] / 1000
-            message_content = {
-                "trade_id": timestamp,  # trade id isn't provided so using timestamp instead
-                "trading_pair": trading_pair,
-                "trade_type": float(TradeType.BUY.value) if trade_data["bm"] else float(TradeType.SELL.value),
-                "amount": Decimal(trade_data["q"]),
-                "price": Decimal(trade_data["p"]),
-            }
-            trade_message: Optional[OrderBookMessage] = OrderBookMessage(
-                message_type=OrderBookMessageType.TRADE, content=message_content, timestamp=timestamp
-            )
-
-            message_queue.put_nowait(trade_message)
+            message_queue.put_nowait(OrderBookMessage(
+                message_type=OrderBookMessageType.TRADE,
+                content={
+                    "trade_id": timestamp,  # trade id isn't provided so using timestamp instead
+                    "trading_pair": trading_pair,
+                    "trade_type": _BUY_TRADE_TYPE if trade_data["bm"] else _SELL_TRADE_TYPE,
+                    "amount": trade_data["q"],
+                    "price": trade_data["p"],
+                },
+                timestamp=timestamp,
+            ))
 
     async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
         diff_data: Dict[str, Any] = raw_message["data"]
         timestamp: float = diff_data["ts"] / 1000
 
-        trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(symbol=raw_message["symbol"])
+        symbol = raw_message["symbol"]
+        trading_pair = (self._trading_pairs_by_symbol.get(symbol)
+                        or await self._connector.trading_pair_associated_to_exchange_symbol(symbol=symbol))
 
-        message_content = {
-            "trading_pair": trading_pair,
-            "update_id": timestamp,
-            "bids": diff_data["bids"],
-            "asks": diff_data["asks"],
-        }
-        diff_message: OrderBookMessage = OrderBookMessage(OrderBookMessageType.DIFF, message_content, timestamp)
+        pending_content = self._pending_diffs_by_pair.get(trading_pair)
+        if pending_content is None:
+            if not self._pending_diffs_by_pair:
+                asyncio.get_event_loop().call_soon(self._enqueue_pending_diffs, message_queue)
+            self._pending_diffs_by_pair[trading_pair] = {
+                "trading_pair": trading_pair,
+                "update_id": timestamp,
+                "bids": diff_data["bids"],
+                "asks": diff_data["asks"],
+            }
+        else:
+            pending_content.setdefault("first_update_id", pending_content["update_id"])
+            pending_content["update_id"] = timestamp
+            pending_content["bids"] = self._merge_diff_levels(pending_content["bids"], diff_data["bids"])
+            pending_content["asks"] = self._merge_diff_levels(pending_content["asks"], diff_data["asks"])
+
+    def _enqueue_pending_diffs(self, message_queue: asyncio.Queue):
+        """
+        Adds one diff message per trading pair to the queue, with all the diffs received for the pair since the
+        previous call merged into it. The message timestamp is the one of the latest merged diff, while the
+        `first_update_id` in its content refers to the earliest one.
+
+        :param message_queue: the queue to add the diff messages to
+        """
+        for content in self._pending_diffs_by_pair.values():
+            message_queue.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, content, content["update_id"]))
+        self._pending_diffs_by_pair.clear()
 
-        message_queue.put_nowait(diff_message)
+    @staticmethod
+    def _merge_diff_levels(levels: List[List[str]], new_levels: List[List[str]]) -> List[List[str]]:
+        # Levels are keyed by their float price, the same conversion the order book applies to them
+        merged_levels = {float(level[0]): level for level in levels}
+        merged_levels.update((float(level[0]), level) for level in new_levels)
+        return list(merged_levels.values())
 
     def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
         channel = ""
         if "data" in event_message:
-            event_channel = event_message.get("m")
-            if event_channel == CONSTANTS.TRADE_TOPIC_ID:
-                channel = self._trade_messages_queue_key
-            if event_channel == CONSTANTS.DIFF_TOPIC_ID:
-                channel = self._diff_messages_queue_key
+            channel = self._channels_by_topic.get(event_message.get("m"), "")
         return channel
 
     async def _process_message_for_unknown_channel(
@@ -148,7 +200,6 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
         :param event_message: the event received through the websocket connection
         :param websocket_assistant: the websocket connection to use to interact with the exchange
         """
-        if event_message.get("m") == "ping":
-            pong_payloads = {"op": "pong"}
-            pong_request = WSJSONRequest(payload=pong_payloads)
+        if event_message.get("m") == CONSTANTS.PING_TOPIC_ID:
+            pong_request = WSJSONRequest(payload={"op": CONSTANTS.PONG_ENDPOINT_NAME})
             await websocket_assistant.send(request=pong_request)
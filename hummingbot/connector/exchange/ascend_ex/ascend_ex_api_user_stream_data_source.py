@@ -73,9 +73,8 @@ class AscendExAPIUserStreamDataSource(UserStreamTrackerDataSource):
     ):
         if len(event_message) > 0:
             message_type = event_message.get("m")
-            if message_type == "ping":
-                pong_payloads = {"op": "pong"}
-                pong_request = WSJSONRequest(payload=pong_payloads)
+            if message_type == CONSTANTS.PING_TOPIC_ID:
+                pong_request = WSJSONRequest(payload={"op": CONSTANTS.PONG_ENDPOINT_NAME})
                 await websocket_assistant.send(request=pong_request)
             elif message_type == CONSTANTS.ORDER_CHANGE_EVENT_TYPE and event_message.get("ac") == "CASH":
                 queue.put_nowait(event_message)
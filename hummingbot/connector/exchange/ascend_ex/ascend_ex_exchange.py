@@ -191,7 +191,7 @@ class AscendExExchange(ExchangePyBase):
         trading_pair = combine_to_hb_trading_pair(base=base_currency, quote=quote_currency)
         if trading_pair in self._trading_fees:
             fees_data = self._trading_fees[trading_pair]
-            fee_value = Decimal(fees_data["maker"]) if is_maker else Decimal(fees_data["taker"])
+            fee_value = fees_data["maker"] if is_maker else fees_data["taker"]
             fee = AddedToCostTradeFee(percent=fee_value)
         else:
             fee = build_trade_fee(
@@ -207,12 +207,14 @@ class AscendExExchange(ExchangePyBase):
         return fee
 
     def _initialize_trading_pair_symbols_from_exchange_info(self, exchange_info: Dict[str, Any]):
-        mapping = bidict()
+        mapping = {}
         for symbol_data in filter(utils.is_pair_information_valid, exchange_info.get("data", [])):
-            if len(symbol_data["symbol"].split("/")) == 2:
-                base, quote = symbol_data["symbol"].split("/")
-                mapping[symbol_data["symbol"]] = combine_to_hb_trading_pair(base, quote)
-        self._set_trading_pair_symbol_map(mapping)
+            symbol = symbol_data["symbol"]
+            symbol_parts = symbol.split("/")
+            if len(symbol_parts) == 2:
+                base, quote = symbol_parts
+                mapping[symbol] = combine_to_hb_trading_pair(base, quote)
+        self._set_trading_pair_symbol_map(bidict(mapping))
 
     async def _place_order(
         self,
@@ -296,27 +298,18 @@ class AscendExExchange(ExchangePyBase):
                     event_timestamp = execution_data["t"] * 1e-3
                     updated_status = CONSTANTS.ORDER_STATE[order_event_type]
 
-                    fillable_order_list = list(
-                        filter(
-                            lambda order: order.exchange_order_id == order_id,
-                            list(self._order_tracker.all_fillable_orders.values()),
-                        )
+                    order_tracker = self._order_tracker
+                    fillable_order = next(
+                        (order for order in order_tracker.all_fillable_orders.values()
+                         if order.exchange_order_id == order_id),
+                        None,
                     )
-                    updatable_order_list = list(
-                        filter(
-                            lambda order: order.exchange_order_id == order_id,
-                            list(self._order_tracker.all_updatable_orders.values()),
-                        )
+                    updatable_order = next(
+                        (order for order in order_tracker.all_updatable_orders.values()
+                         if order.exchange_order_id == order_id),
+                        None,
                     )
 
-                    fillable_order = None
-                    if len(fillable_order_list) > 0:
-                        fillable_order = fillable_order_list[0]
-
-                    updatable_order = None
-                    if len(updatable_order_list) > 0:
-                        updatable_order = updatable_order_list[0]
-
                     if fillable_order is not None and updated_status in [
                         OrderState.PARTIALLY_FILLED,
                         OrderState.FILLED,
@@ -428,7 +421,11 @@ class AscendExExchange(ExchangePyBase):
         for fee_json in fees_json:
             try:
                 trading_pair = await self.trading_pair_associated_to_exchange_symbol(symbol=fee_json["symbol"])
-                self._trading_fees[trading_pair] = fee_json["fee"]
+                fee_data = fee_json["fee"]
+                self._trading_fees[trading_pair] = {
+                    "maker": Decimal(fee_data["maker"]),
+                    "taker": Decimal(fee_data["taker"]),
+                }
             except asyncio.CancelledError:
                 raise
             except Exception:
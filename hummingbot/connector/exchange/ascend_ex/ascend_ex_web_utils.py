@@ -1,4 +1,5 @@
 import time
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
 from hummingbot.connector.exchange.ascend_ex import ascend_ex_constants as CONSTANTS
@@ -8,19 +9,17 @@ from hummingbot.core.web_assistant.connections.data_types import RESTRequest
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
+# Generic headers required by AscendEx in every REST request
+_GENERIC_HEADERS = MappingProxyType({"Accept": "application/json", "Content-Type": "application/json"})
+
 
 class AscendExRESTPreProcessor(RESTPreProcessorBase):
     async def pre_process(self, request: RESTRequest) -> RESTRequest:
         if request.headers is None:
             request.headers = {}
-        # Generates generic headers required by AscendEx
-        headers_generic = {}
-        headers_generic["Accept"] = "application/json"
-        headers_generic["Content-Type"] = "application/json"
+        request.headers.update(_GENERIC_HEADERS)
         # Headers signature to identify user as an HB liquidity provider.
-        request.headers = dict(
-            list(request.headers.items()) + list(headers_generic.items()) + list(get_hb_id_headers().items())
-        )
+        request.headers.update(get_hb_id_headers())
         return request
 
 
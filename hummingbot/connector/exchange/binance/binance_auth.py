@@ -1,7 +1,6 @@
 import hashlib
 import hmac
 import json
-from collections import OrderedDict
 from typing import Any, Dict
 from urllib.parse import urlencode
 
@@ -15,6 +14,9 @@ class BinanceAuth(AuthBase):
         self.api_key = api_key
         self.secret_key = secret_key
         self.time_provider = time_provider
+        # Keyed with the secret, it is never updated directly: every signature is computed on a copy of it
+        self._keyed_hmac = hmac.new(secret_key.encode("utf8"), digestmod=hashlib.sha256)
+        self._auth_header = {"X-MBX-APIKEY": api_key}
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         """
@@ -46,8 +48,7 @@ class BinanceAuth(AuthBase):
                            params: Dict[str, Any]):
         timestamp = int(self.time_provider.time() * 1e3)
 
-        request_params = OrderedDict(params or {})
-        request_params["timestamp"] = timestamp
+        request_params = {**(params or {}), "timestamp": timestamp}
 
         signature = self._generate_signature(params=request_params)
         request_params["signature"] = signature
@@ -55,10 +56,13 @@ class BinanceAuth(AuthBase):
         return request_params
 
     def header_for_authentication(self) -> Dict[str, str]:
-        return {"X-MBX-APIKEY": self.api_key}
+        # The same dict is returned on every call, callers must not modify it
+        return self._auth_header
 
     def _generate_signature(self, params: Dict[str, Any]) -> str:
 
         encoded_params_str = urlencode(params)
-        digest = hmac.new(self.secret_key.encode("utf8"), encoded_params_str.encode("utf8"), hashlib.sha256).hexdigest()
+        signature_hmac = self._keyed_hmac.copy()
+        signature_hmac.update(encoded_params_str.encode("utf8"))
+        digest = signature_hmac.hexdigest()
         return digest
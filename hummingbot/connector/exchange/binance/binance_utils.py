@@ -22,20 +22,11 @@ def is_exchange_information_valid(exchange_info: Dict[str, Any]) -> bool:
     :param exchange_info: the exchange information for a trading pair
     :return: True if the trading pair is enabled, False otherwise
     """
-    is_spot = False
-    is_trading = False
+    if exchange_info.get("status") != "TRADING":
+        return False
 
-    if exchange_info.get("status", None) == "TRADING":
-        is_trading = True
-
-    permissions_sets = exchange_info.get("permissionSets", list())
-    for permission_set in permissions_sets:
-        # PermissionSet is a list, find if in this list we have "SPOT" value or not
-        if "SPOT" in permission_set:
-            is_spot = True
-            break
-
-    return is_trading and is_spot
+    # Each permission set is a list, the pair is a spot pair if any of them contains the "SPOT" value
+    return any("SPOT" in permission_set for permission_set in exchange_info.get("permissionSets", ()))
 
 
 class BinanceConfigMap(BaseConnectorConfigMap):
@@ -1,3 +1,4 @@
+import weakref
 from typing import Callable, Optional
 
 import hummingbot.connector.exchange.binance.binance_constants as CONSTANTS
@@ -8,6 +9,10 @@ from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
+# Factories used for the server time requests, one per throttler so that each one keeps its own aiohttp session.
+# The factories only hold a proxy to their throttler, which lets the entry go away with the throttler
+_time_sync_api_factories: "weakref.WeakKeyDictionary[AsyncThrottler, WebAssistantsFactory]" = weakref.WeakKeyDictionary()
+
 
 def public_rest_url(path_url: str, domain: str = CONSTANTS.DEFAULT_DOMAIN) -> str:
     """
@@ -64,7 +69,10 @@ async def get_current_server_time(
         domain: str = CONSTANTS.DEFAULT_DOMAIN,
 ) -> float:
     throttler = throttler or create_throttler()
-    api_factory = build_api_factory_without_time_synchronizer_pre_processor(throttler=throttler)
+    api_factory = _time_sync_api_factories.get(throttler)
+    if api_factory is None:
+        api_factory = build_api_factory_without_time_synchronizer_pre_processor(throttler=weakref.proxy(throttler))
+        _time_sync_api_factories[throttler] = api_factory
     rest_assistant = await api_factory.get_rest_assistant()
     response = await rest_assistant.execute_request(
         url=public_rest_url(path_url=CONSTANTS.SERVER_TIME_PATH_URL, domain=domain),
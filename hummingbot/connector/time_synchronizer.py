@@ -41,6 +41,13 @@ class TimeSynchronizer:
 
         return offset
 
+    @property
+    def is_initialized(self) -> bool:
+        """
+        Indicates if at least one server time sample has been registered
+        """
+        return len(self._time_offset_ms) > 0
+
     def add_time_offset_ms_sample(self, offset: float):
         self._time_offset_ms.append(offset)
 
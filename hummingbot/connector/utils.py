@@ -103,7 +103,8 @@ class TimeSynchronizerRESTPreProcessor(RESTPreProcessorBase):
         self._time_provider = time_provider
 
     async def pre_process(self, request: RESTRequest) -> RESTRequest:
-        await self._synchronizer.update_server_time_if_not_initialized(time_provider=self._time_provider())
+        if not self._synchronizer.is_initialized:
+            await self._synchronizer.update_server_time_if_not_initialized(time_provider=self._time_provider())
         return request
 
 
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import sys
 import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
@@ -66,7 +67,20 @@ class AsyncRequestContextBase(ABC):
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def is_unlimited(self) -> bool:
+        """
+        Checks if the task and all its related limits are configured without an effective limit (sys.maxsize)
+        :return: True if the task can never be rejected by any of its rate limits
+        """
+        return (
+            self._rate_limit is not None
+            and self._rate_limit.limit >= sys.maxsize
+            and all(limit.limit >= sys.maxsize for limit, _ in self._related_limits)
+        )
+
     async def acquire(self):
+        if self.is_unlimited():
+            return
         while True:
             async with self._lock:
                 self.flush()
@@ -26,11 +26,12 @@ class AsyncRequestContext(AsyncRequestContextBase):
             list_of_limits: List[Tuple[RateLimit, int]] = [(self._rate_limit,
                                                             self._rate_limit.weight)] + self._related_limits
             now: float = self._time()
+            decimal_now: Decimal = Decimal(str(now))
             for rate_limit, weight in list_of_limits:
                 capacity_used: int = sum([task.weight
                                           for task in self._task_logs
                                           if rate_limit.limit_id == task.rate_limit.limit_id and
-                                          Decimal(str(now)) - Decimal(str(task.timestamp)) - Decimal(str(task.rate_limit.time_interval * self._safety_margin_pct)) <= task.rate_limit.time_interval])
+                                          decimal_now - Decimal(str(task.timestamp)) - Decimal(str(task.rate_limit.time_interval * self._safety_margin_pct)) <= task.rate_limit.time_interval])
 
                 if capacity_used + weight > rate_limit.limit:
                     if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
@@ -2,6 +2,7 @@ import asyncio
 import copy
 import logging
 import math
+import sys
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
@@ -61,7 +62,9 @@ class AsyncThrottlerBase(ABC):
         self._rate_limits: List[RateLimit] = copy.deepcopy(rate_limits)
 
         for rate_limit in self._rate_limits:
-            rate_limit.limit = max(Decimal("1"), math.floor(Decimal(str(rate_limit.limit)) * self.limits_pct))
+            # sys.maxsize marks an unlimited rate limit, it is never scaled
+            if rate_limit.limit < sys.maxsize:
+                rate_limit.limit = max(Decimal("1"), math.floor(Decimal(str(rate_limit.limit)) * self.limits_pct))
 
         # Dictionary of path_url to RateLimit
         self._id_to_limit_map: Dict[str, RateLimit] = {limit.limit_id: limit for limit in self._rate_limits}
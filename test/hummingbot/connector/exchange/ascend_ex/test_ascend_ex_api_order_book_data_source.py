@@ -189,6 +189,28 @@ class AscendExAPIOrderBookDataSourceUnitTests(TestCase):
 
         self.assertTrue(self._is_logged("INFO", "Subscribed to public order book and trade channels..."))
 
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_listen_for_subscriptions_sends_pong_on_ping(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+
+        for _ in range(2):
+            self.mocking_assistant.add_websocket_aiohttp_message(
+                websocket_mock=ws_connect_mock.return_value, message=json.dumps({"m": "ping", "hp": 3})
+            )
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value, message=json.dumps({})
+        )
+
+        self.listening_task = self.ev_loop.create_task(self.data_source.listen_for_subscriptions())
+
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(
+            websocket_mock=ws_connect_mock.return_value
+        )
+
+        self.assertEqual([{"op": "pong"}, {"op": "pong"}], sent_messages[-2:])
+
     @patch("hummingbot.core.data_type.order_book_tracker_data_source.OrderBookTrackerDataSource._sleep")
     @patch("aiohttp.ClientSession.ws_connect")
     def test_listen_for_subscriptions_raises_cancel_exception(self, mock_ws, _: AsyncMock):
@@ -234,6 +256,31 @@ class AscendExAPIOrderBookDataSourceUnitTests(TestCase):
             self._is_logged("ERROR", "Unexpected error occurred subscribing to order book trading and delta streams...")
         )
 
+    def test_subscribe_channels_reuses_subscription_requests_on_reconnection(self):
+        mock_ws = AsyncMock()
+
+        self.async_run_with_timeout(self.data_source._subscribe_channels(mock_ws))
+        first_requests = [call.args[0] for call in mock_ws.send.call_args_list]
+
+        with patch.object(self.connector, "exchange_symbol_associated_to_pair") as symbol_mock:
+            mock_ws.send.reset_mock()
+            self.async_run_with_timeout(self.data_source._subscribe_channels(mock_ws))
+            symbol_mock.assert_not_called()
+
+        self.assertEqual(first_requests, [call.args[0] for call in mock_ws.send.call_args_list])
+        self.assertEqual({"op": "sub", "ch": f"depth:{self.ex_trading_pair}"}, first_requests[0].payload)
+        self.assertEqual({"op": "sub", "ch": f"trades:{self.ex_trading_pair}"}, first_requests[1].payload)
+
+    def test_channel_originating_message(self):
+        self.assertEqual(
+            CONSTANTS.TRADE_TOPIC_ID, self.data_source._channel_originating_message(self._trade_update_event())
+        )
+        self.assertEqual(
+            CONSTANTS.DIFF_TOPIC_ID, self.data_source._channel_originating_message(self._order_diff_event())
+        )
+        self.assertEqual("", self.data_source._channel_originating_message({"m": "ping", "hp": 3}))
+        self.assertEqual("", self.data_source._channel_originating_message({"m": "depth-snapshot", "data": {}}))
+
     def test_listen_for_trades_cancelled_when_listening(self):
         mock_queue = MagicMock()
         mock_queue.get.side_effect = asyncio.CancelledError()
@@ -278,6 +325,26 @@ class AscendExAPIOrderBookDataSourceUnitTests(TestCase):
         msg: OrderBookMessage = self.async_run_with_timeout(msg_queue.get())
 
         self.assertEqual(12.345, msg.trade_id)
+        self.assertEqual("0.068600", msg.content["price"])
+        self.assertEqual("100.000", msg.content["amount"])
+
+    def test_listen_for_trades_resolves_subscribed_symbols_without_connector(self):
+        self.async_run_with_timeout(self.data_source._subscribe_channels(AsyncMock()))
+
+        mock_queue = AsyncMock()
+        mock_queue.get.side_effect = [self._trade_update_event(), asyncio.CancelledError()]
+        self.data_source._message_queue[CONSTANTS.TRADE_TOPIC_ID] = mock_queue
+
+        msg_queue: asyncio.Queue = asyncio.Queue()
+
+        with patch.object(self.connector, "trading_pair_associated_to_exchange_symbol") as trading_pair_mock:
+            self.listening_task = self.ev_loop.create_task(
+                self.data_source.listen_for_trades(self.ev_loop, msg_queue)
+            )
+            msg: OrderBookMessage = self.async_run_with_timeout(msg_queue.get())
+            trading_pair_mock.assert_not_called()
+
+        self.assertEqual(self.trading_pair, msg.trading_pair)
 
     def test_listen_for_order_book_diffs_cancelled(self):
         mock_queue = AsyncMock()
@@ -333,6 +400,58 @@ class AscendExAPIOrderBookDataSourceUnitTests(TestCase):
 
         self.assertEqual(diff_event["data"]["ts"] / 1000, msg.update_id)
 
+    def test_listen_for_order_book_diffs_coalesces_burst_for_same_pair(self):
+        mock_queue = AsyncMock()
+        first_diff_event = self._order_diff_event()
+        second_diff_event = self._order_diff_event()
+        second_diff_event["data"]["ts"] = first_diff_event["data"]["ts"] + 1
+        second_diff_event["data"]["asks"] = [["0.06844", "0"], ["0.07", "5"]]
+        second_diff_event["data"]["bids"] = []
+        mock_queue.get.side_effect = [first_diff_event, second_diff_event, asyncio.CancelledError()]
+        self.data_source._message_queue[CONSTANTS.DIFF_TOPIC_ID] = mock_queue
+
+        msg_queue: asyncio.Queue = asyncio.Queue()
+
+        self.listening_task = self.ev_loop.create_task(
+            self.data_source.listen_for_order_book_diffs(self.ev_loop, msg_queue)
+        )
+
+        msg: OrderBookMessage = self.async_run_with_timeout(msg_queue.get())
+
+        self.assertTrue(msg_queue.empty())
+        self.assertEqual(first_diff_event["data"]["ts"] / 1000, msg.first_update_id)
+        self.assertEqual(second_diff_event["data"]["ts"] / 1000, msg.update_id)
+        self.assertEqual(second_diff_event["data"]["ts"] / 1000, msg.timestamp)
+        self.assertEqual([["0.06844", "0"], ["0.07", "5"]], msg.content["asks"])
+        self.assertEqual([["0.06777", "562.4"], ["0.05", "221760.6"]], msg.content["bids"])
+        self.assertEqual({}, self.data_source._pending_diffs_by_pair)
+
+    def test_listen_for_order_book_diffs_coalesces_same_price_with_different_spelling(self):
+        mock_queue = AsyncMock()
+        diff_events = []
+        for index, ask in enumerate([["0.068", "5"], ["0.0680", "0"], ["0.068", "7"]]):
+            diff_event = self._order_diff_event()
+            diff_event["data"]["ts"] += index
+            diff_event["data"]["asks"] = [ask]
+            diff_event["data"]["bids"] = []
+            diff_events.append(diff_event)
+        mock_queue.get.side_effect = diff_events + [asyncio.CancelledError()]
+        self.data_source._message_queue[CONSTANTS.DIFF_TOPIC_ID] = mock_queue
+
+        msg_queue: asyncio.Queue = asyncio.Queue()
+
+        self.listening_task = self.ev_loop.create_task(
+            self.data_source.listen_for_order_book_diffs(self.ev_loop, msg_queue)
+        )
+
+        msg: OrderBookMessage = self.async_run_with_timeout(msg_queue.get())
+
+        self.assertTrue(msg_queue.empty())
+        self.assertEqual([["0.068", "7"]], msg.content["asks"])
+        self.assertEqual(1, len(msg.asks))
+        self.assertEqual(0.068, msg.asks[0].price)
+        self.assertEqual(7, msg.asks[0].amount)
+
     @aioresponses()
     def test_listen_for_order_book_snapshots_cancelled_when_fetching_snapshot(self, mock_api):
         # url = f"{web_utils.public_rest_url(path_url=CONSTANTS.DEPTH_PATH_URL)}?symbol={self.ex_trading_pair}"
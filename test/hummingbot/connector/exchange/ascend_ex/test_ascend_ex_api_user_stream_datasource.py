@@ -188,6 +188,28 @@ class AscendExUserStreamTrackerTests(TestCase):
 
         self.assertEqual(0, msg_queue.qsize())
 
+    @aioresponses()
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_listen_for_user_stream_sends_pong_on_ping(self, mock_api, mock_ws):
+        url = web_utils.public_rest_url(path_url=CONSTANTS.INFO_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+
+        resp = self.get_listen_key_mock()
+        mock_api.get(regex_url, body=json.dumps(resp))
+
+        mock_ws.return_value = self.mocking_assistant.create_websocket_mock()
+        self.mocking_assistant.add_websocket_aiohttp_message(mock_ws.return_value, json.dumps({"m": "ping", "hp": 3}))
+        self.mocking_assistant.add_websocket_aiohttp_message(mock_ws.return_value, json.dumps({}))
+
+        msg_queue = asyncio.Queue()
+        self.listening_task = self.ev_loop.create_task(self.data_source.listen_for_user_stream(msg_queue))
+
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(mock_ws.return_value)
+
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(mock_ws.return_value)
+        self.assertEqual({"op": "pong"}, sent_messages[-1])
+        self.assertEqual(0, msg_queue.qsize())
+
     @aioresponses()
     @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
     @patch(
@@ -625,6 +625,51 @@ class AscendExExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTest
     def trade_event_for_partial_fill_websocket_update(self, order: InFlightOrder):
         return None
 
+    @aioresponses()
+    def test_update_trading_fees(self, mock_api):
+        url = self.private_rest_url(CONSTANTS.FEE_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        fees_response = {
+            "code": 0,
+            "data": {
+                "domain": "spot",
+                "userUID": "U1234567890",
+                "vipLevel": 0,
+                "fees": [
+                    {
+                        "symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                        "fee": {"taker": "0.002", "maker": "0.001"},
+                    },
+                ],
+            },
+        }
+        mock_api.get(regex_url, body=json.dumps(fees_response))
+
+        self.async_run_with_timeout(self.exchange._update_trading_fees())
+
+        self.assertEqual(
+            {"maker": Decimal("0.001"), "taker": Decimal("0.002")}, self.exchange._trading_fees[self.trading_pair]
+        )
+        maker_fee = self.exchange.get_fee(
+            base_currency=self.base_asset,
+            quote_currency=self.quote_asset,
+            order_type=OrderType.LIMIT_MAKER,
+            order_side=TradeType.BUY,
+            amount=Decimal("1"),
+            price=Decimal("10"),
+        )
+        self.assertEqual(Decimal("0.001"), maker_fee.percent)
+        taker_fee = self.exchange.get_fee(
+            base_currency=self.base_asset,
+            quote_currency=self.quote_asset,
+            order_type=OrderType.LIMIT,
+            order_side=TradeType.BUY,
+            amount=Decimal("1"),
+            price=Decimal("10"),
+            is_maker=False,
+        )
+        self.assertEqual(Decimal("0.002"), taker_fee.percent)
+
     @aioresponses()
     def test_update_order_status_when_canceled(self, mock_api):
         self.exchange._set_current_timestamp(1640780000)
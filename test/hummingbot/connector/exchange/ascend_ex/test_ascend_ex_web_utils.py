@@ -1,6 +1,8 @@
+import asyncio
 from unittest import TestCase
 
 from hummingbot.connector.exchange.ascend_ex import ascend_ex_constants as CONSTANTS, ascend_ex_web_utils as web_utils
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
 
 
 class AscendExWebUtilsTests(TestCase):
@@ -13,3 +15,29 @@ class AscendExWebUtilsTests(TestCase):
         path_url = "/TEST_PATH"
         expected_url = CONSTANTS.PRIVATE_REST_URL + path_url
         self.assertEqual(expected_url, web_utils.private_rest_url(path_url))
+
+    def test_rest_pre_processor_adds_generic_headers(self):
+        pre_processor = web_utils.AscendExRESTPreProcessor()
+        request = RESTRequest(method=RESTMethod.GET, url="https://test.url", headers={"x-auth-key": "key"})
+
+        processed_request = asyncio.get_event_loop().run_until_complete(pre_processor.pre_process(request))
+
+        self.assertEqual(
+            {
+                "x-auth-key": "key",
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "request-source": "hummingbot-liq-mining",
+            },
+            processed_request.headers,
+        )
+
+    def test_rest_pre_processor_creates_headers_when_missing(self):
+        pre_processor = web_utils.AscendExRESTPreProcessor()
+        request = RESTRequest(method=RESTMethod.GET, url="https://test.url")
+
+        processed_request = asyncio.get_event_loop().run_until_complete(pre_processor.pre_process(request))
+
+        self.assertEqual("application/json", processed_request.headers["Accept"])
+        self.assertEqual("application/json", processed_request.headers["Content-Type"])
+        self.assertEqual("hummingbot-liq-mining", processed_request.headers["request-source"])
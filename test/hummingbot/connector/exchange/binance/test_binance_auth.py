@@ -1,7 +1,6 @@
 import asyncio
 import hashlib
 import hmac
-from copy import copy
 from unittest import TestCase
 from unittest.mock import MagicMock
 
@@ -34,13 +33,12 @@ class BinanceAuthTests(TestCase):
             "quantity": 1,
             "price": "0.1",
         }
-        full_params = copy(params)
 
         auth = BinanceAuth(api_key=self._api_key, secret_key=self._secret, time_provider=mock_time_provider)
         request = RESTRequest(method=RESTMethod.GET, params=params, is_auth_required=True)
         configured_request = self.async_run_with_timeout(auth.rest_authenticate(request))
 
-        full_params.update({"timestamp": 1234567890000})
+        full_params = {**params, "timestamp": 1234567890000}
         encoded_params = "&".join([f"{key}={value}" for key, value in full_params.items()])
         expected_signature = hmac.new(
             self._secret.encode("utf-8"),
@@ -49,3 +47,24 @@ class BinanceAuthTests(TestCase):
         self.assertEqual(now * 1e3, configured_request.params["timestamp"])
         self.assertEqual(expected_signature, configured_request.params["signature"])
         self.assertEqual({"X-MBX-APIKEY": self._api_key}, configured_request.headers)
+
+    def test_consecutive_signatures_do_not_share_state(self):
+        now = 1234567890.000
+        mock_time_provider = MagicMock()
+        mock_time_provider.time.return_value = now
+
+        auth = BinanceAuth(api_key=self._api_key, secret_key=self._secret, time_provider=mock_time_provider)
+
+        for params in ({"symbol": "LTCBTC"}, {"symbol": "ETHBTC", "side": "SELL"}):
+            configured_request = self.async_run_with_timeout(
+                auth.rest_authenticate(RESTRequest(method=RESTMethod.GET, params=params, is_auth_required=True))
+            )
+
+            encoded_params = "&".join(
+                [f"{key}={value}" for key, value in {**params, "timestamp": 1234567890000}.items()]
+            )
+            expected_signature = hmac.new(
+                self._secret.encode("utf-8"),
+                encoded_params.encode("utf-8"),
+                hashlib.sha256).hexdigest()
+            self.assertEqual(expected_signature, configured_request.params["signature"])
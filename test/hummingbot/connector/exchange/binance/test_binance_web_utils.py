@@ -1,11 +1,24 @@
+import asyncio
+import gc
+import json
 import unittest
 
+from aioresponses import aioresponses
+
 import hummingbot.connector.exchange.binance.binance_constants as CONSTANTS
 from hummingbot.connector.exchange.binance import binance_web_utils as web_utils
 
 
 class BinanceUtilTestCases(unittest.TestCase):
 
+    def setUp(self) -> None:
+        super().setUp()
+        web_utils._time_sync_api_factories.clear()
+
+    def tearDown(self) -> None:
+        web_utils._time_sync_api_factories.clear()
+        super().tearDown()
+
     def test_public_rest_url(self):
         path_url = "/TEST_PATH"
         domain = "com"
@@ -17,3 +30,37 @@ class BinanceUtilTestCases(unittest.TestCase):
         domain = "com"
         expected_url = CONSTANTS.REST_URL.format(domain) + CONSTANTS.PRIVATE_API_VERSION + path_url
         self.assertEqual(expected_url, web_utils.private_rest_url(path_url, domain))
+
+    @aioresponses()
+    def test_get_current_server_time_reuses_api_factory_for_each_throttler(self, mock_api):
+        url = web_utils.public_rest_url(path_url=CONSTANTS.SERVER_TIME_PATH_URL)
+        mock_api.get(url, body=json.dumps({"serverTime": 1640000000000}), repeat=True)
+        throttler = web_utils.create_throttler()
+        other_throttler = web_utils.create_throttler()
+
+        server_time = asyncio.get_event_loop().run_until_complete(
+            web_utils.get_current_server_time(throttler=throttler))
+        api_factory = web_utils._time_sync_api_factories[throttler]
+        asyncio.get_event_loop().run_until_complete(web_utils.get_current_server_time(throttler=other_throttler))
+        other_api_factory = web_utils._time_sync_api_factories[other_throttler]
+        asyncio.get_event_loop().run_until_complete(web_utils.get_current_server_time(throttler=throttler))
+        asyncio.get_event_loop().run_until_complete(web_utils.get_current_server_time(throttler=other_throttler))
+
+        self.assertEqual(1640000000000, server_time)
+        self.assertIsNot(api_factory, other_api_factory)
+        self.assertIs(api_factory, web_utils._time_sync_api_factories[throttler])
+        self.assertIs(other_api_factory, web_utils._time_sync_api_factories[other_throttler])
+
+    @aioresponses()
+    def test_get_current_server_time_api_factory_released_with_throttler(self, mock_api):
+        url = web_utils.public_rest_url(path_url=CONSTANTS.SERVER_TIME_PATH_URL)
+        mock_api.get(url, body=json.dumps({"serverTime": 1640000000000}))
+        throttler = web_utils.create_throttler()
+
+        asyncio.get_event_loop().run_until_complete(web_utils.get_current_server_time(throttler=throttler))
+        self.assertEqual(1, len(web_utils._time_sync_api_factories))
+
+        del throttler
+        gc.collect()
+
+        self.assertEqual(0, len(web_utils._time_sync_api_factories))
@@ -75,3 +75,13 @@ class TimeSynchronizerTests(TestCase):
         calculated_offset = numpy.mean([calculated_median, calculated_weighted_average])
 
         self.assertEqual(calculated_offset + seconds_difference_when_calculating_current_time, synchronized_time)
+
+    def test_is_initialized_after_first_sample(self):
+        time_provider = TimeSynchronizer()
+        self.assertFalse(time_provider.is_initialized)
+
+        time_provider.add_time_offset_ms_sample(10)
+        self.assertTrue(time_provider.is_initialized)
+
+        time_provider.clear_time_offset_ms_samples()
+        self.assertFalse(time_provider.is_initialized)
@@ -1,3 +1,4 @@
+import asyncio
 import importlib
 import os
 import platform
@@ -14,7 +15,9 @@ from hummingbot import root_path
 from hummingbot.client.config.config_data_types import BaseConnectorConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
-from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.connector.time_synchronizer import TimeSynchronizer
+from hummingbot.connector.utils import TimeSynchronizerRESTPreProcessor, get_new_client_order_id
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
 
 
 class UtilsTest(unittest.TestCase):
@@ -37,6 +40,23 @@ class UtilsTest(unittest.TestCase):
 
         self.assertEqual(len(id0) - 2, len(id2))
 
+    def test_time_synchronizer_pre_processor_initializes_synchronizer_once(self):
+        synchronizer = TimeSynchronizer()
+        requested_server_times = []
+
+        async def server_time_provider():
+            requested_server_times.append(1640000000000)
+            return 1640000000000
+
+        pre_processor = TimeSynchronizerRESTPreProcessor(synchronizer=synchronizer, time_provider=server_time_provider)
+        request = RESTRequest(method=RESTMethod.GET, url="https://test.url")
+
+        for _ in range(3):
+            asyncio.get_event_loop().run_until_complete(pre_processor.pre_process(request))
+
+        self.assertTrue(synchronizer.is_initialized)
+        self.assertEqual(1, len(requested_server_times))
+
     @patch("hummingbot.connector.utils.get_tracking_nonce")
     def test_get_new_client_order_id_with_max_len_less_than_required_to_include_time_hashes_it(self, nonce_mock):
         nonce_mock.return_value = 1640001112223334
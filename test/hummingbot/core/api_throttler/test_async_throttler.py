@@ -68,14 +68,16 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
 
         rate_limits = self.rate_limits.copy()
         rate_limits.append(RateLimit(limit_id="ANOTHER_TEST", limit=10, time_interval=5))
+        rate_limits.append(RateLimit(limit_id="UNLIMITED_TEST", limit=sys.maxsize, time_interval=5))
         expected_limit = math.floor(Decimal("10") * rate_share_pct / Decimal("100"))
 
         throttler = AsyncThrottler(rate_limits=rate_limits, limits_share_percentage=rate_share_pct)
         self.assertEqual(0.1, throttler._retry_interval)
-        self.assertEqual(6, len(throttler._rate_limits))
+        self.assertEqual(7, len(throttler._rate_limits))
         self.assertEqual(Decimal("1"), throttler._id_to_limit_map[TEST_POOL_ID].limit)
         self.assertEqual(Decimal("1"), throttler._id_to_limit_map[TEST_PATH_URL].limit)
         self.assertEqual(expected_limit, throttler._id_to_limit_map["ANOTHER_TEST"].limit)
+        self.assertEqual(sys.maxsize, throttler._id_to_limit_map["UNLIMITED_TEST"].limit)
 
     def test_get_related_limits(self):
         self.assertEqual(5, len(self.throttler._rate_limits))
@@ -211,6 +213,33 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         # We acquire()'d just one rate_limit, task log should have only one entry
         self.assertEqual(1, len(self.throttler._task_logs))
 
+    def test_acquire_does_not_log_unlimited_tasks(self):
+        unlimited_pool = RateLimit(limit_id="unlimited_pool", limit=sys.maxsize, time_interval=1)
+        unlimited_limit = RateLimit(limit_id="unlimited", limit=sys.maxsize, time_interval=1,
+                                    linked_limits=[LinkedLimitWeightPair(unlimited_pool.limit_id)])
+        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+                                      rate_limit=unlimited_limit,
+                                      related_limits=[(unlimited_pool, 1)],
+                                      lock=asyncio.Lock(),
+                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        self.assertTrue(context.is_unlimited())
+        self.ev_loop.run_until_complete(context.acquire())
+
+        self.assertEqual(0, len(self.throttler._task_logs))
+
+    def test_acquire_logs_unlimited_tasks_with_limited_related_limits(self):
+        unlimited_limit = RateLimit(limit_id="unlimited", limit=sys.maxsize, time_interval=1,
+                                    linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)])
+        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+                                      rate_limit=unlimited_limit,
+                                      related_limits=[(self.rate_limits[0], 1)],
+                                      lock=asyncio.Lock(),
+                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        self.assertFalse(context.is_unlimited())
+        self.ev_loop.run_until_complete(context.acquire())
+
+        self.assertEqual(2, len(self.throttler._task_logs))
+
     def test_acquire_awaits_when_exceed_capacity(self):
         rate_limit = self.rate_limits[0]
         self.throttler._task_logs.append(